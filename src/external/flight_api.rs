@@ -6,6 +6,10 @@ use cached::proc_macro::cached;
 use std::time::Duration;
 use chrono::{DateTime, Utc};
 
+/// Delay compensation tiers as `(minimum delay in minutes, amount)`, longest delay first.
+const STANDARD_COMPENSATION_TIERS: [(i32, u64); 4] = [(180, 300), (120, 200), (60, 100), (30, 50)];
+const PREMIUM_COMPENSATION_TIERS: [(i32, u64); 4] = [(180, 600), (120, 400), (60, 200), (30, 100)];
+
 // Flight status response structure
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct FlightStatus {
@@ -27,7 +31,7 @@ impl FlightStatus {
     }
 
     pub fn is_cancelled(&self) -> bool {
-        self.status.to_lowercase() == "cancelled"
+        self.status.eq_ignore_ascii_case("cancelled")
     }
 
     pub fn get_compensation_amount(&self, policy_type: &str) -> u64 {
@@ -37,35 +41,20 @@ impl FlightStatus {
         }
         
         // Compensation calculation based on policy type and delay duration
-        match policy_type {
-            "standard" => {
-                if self.is_cancelled() {
-                    return 500; // Full compensation for cancellation
-                } else if self.delay_minutes >= 180 {  // 3+ hours
-                    return 300;
-                } else if self.delay_minutes >= 120 {  // 2+ hours
-                    return 200;
-                } else if self.delay_minutes >= 60 {   // 1+ hour
-                    return 100;
-                } else {  // 30+ minutes
-                    return 50;
-                }
-            },
-            "premium" => {
-                if self.is_cancelled() {
-                    return 1000; // Enhanced compensation for cancellation
-                } else if self.delay_minutes >= 180 {
-                    return 600;
-                } else if self.delay_minutes >= 120 {
-                    return 400;
-                } else if self.delay_minutes >= 60 {
-                    return 200;
-                } else {
-                    return 100;
-                }
-            },
-            _ => 0,
+        let (cancellation_amount, tiers) = match policy_type {
+            "standard" => (500, &STANDARD_COMPENSATION_TIERS), // Full compensation for cancellation
+            "premium" => (1000, &PREMIUM_COMPENSATION_TIERS),  // Enhanced compensation for cancellation
+            _ => return 0,
+        };
+
+        if self.is_cancelled() {
+            return cancellation_amount;
         }
+
+        // First tier whose threshold the delay meets; the 30-minute tier always matches here
+        tiers.iter()
+            .find(|(min_delay, _)| self.delay_minutes >= *min_delay)
+            .map_or(0, |(_, amount)| *amount)
     }
 }
 
@@ -195,8 +184,10 @@ impl AviationStackApi {
         println!("WARNING: Using simulated flight data (no API key provided)");
         
         // Create a deterministic delay based on flight number
-        let flight_num_sum: u32 = flight_number.chars()
+        let flight_digits: String = flight_number.chars()
             .filter(|c| c.is_ascii_digit())
+            .collect();
+        let flight_num_sum: u32 = flight_digits.chars()
             .map(|c| c.to_digit(10).unwrap_or(0))
             .sum();
         
@@ -244,7 +235,7 @@ impl AviationStackApi {
         let raw_data = serde_json::json!({
             "flight": {
                 "iata": flight_number,
-                "number": flight_number.chars().filter(|c| c.is_ascii_digit()).collect::<String>()
+                "number": flight_digits
             },
             "departure": {
                 "airport": "SIM",
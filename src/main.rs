@@ -420,10 +420,13 @@ fn print_audit_summary(security_audit_log: &Arc<SecurityAuditLog>) {
      if event_types.is_empty() {
          println!("  (No events)");
      } else {
-         let mut sorted_types: Vec<_> = event_types.into_iter().collect();
-         sorted_types.sort_by_key(|k| format!("{:?}", k.0));
+         // Format each type label once, then sort and print the preformatted rows
+         let mut sorted_types: Vec<(String, usize)> = event_types.into_iter()
+             .map(|(event_type, count)| (format!("{:?}", event_type), count))
+             .collect();
+         sorted_types.sort_unstable();
          for (event_type, count) in sorted_types {
-             println!("  - {:<25}: {}", format!("{:?}", event_type), count);
+             println!("  - {:<25}: {}", event_type, count);
          }
      }
 
@@ -432,7 +435,7 @@ fn print_audit_summary(security_audit_log: &Arc<SecurityAuditLog>) {
          println!("  (No events)");
      } else {
         let mut sorted_severities: Vec<_> = event_severities.into_iter().collect();
-        sorted_severities.sort_by_key(|k| k.0.clone());
+        sorted_severities.sort_unstable_by(|a, b| a.0.cmp(&b.0));
         for (severity, count) in sorted_severities {
             println!("  - {:<10}: {}", format!("{:?}", severity).to_uppercase(), count);
         }
@@ -4,7 +4,7 @@ use super::performance::{PerformanceMetrics, ComponentBenchmark};
 use anyhow::Result;
 use std::collections::HashMap;
 use std::fs::File;
-use std::io::Write;
+use std::io::{BufWriter, Write};
 use std::sync::{Arc, Mutex};
 
 /// Thread-safe storage for performance metrics and component benchmarks.
@@ -50,10 +50,11 @@ impl MetricsStorage {
     pub fn save_metrics_to_json_file(&self, filename: &str) -> Result<()> {
         let metrics = self.get_all_metrics();
         let json_metrics: Vec<serde_json::Value> = metrics.iter().map(|m| m.to_json()).collect();
-        let json = serde_json::to_string_pretty(&json_metrics)?;
 
-        let mut file = File::create(filename)?;
-        file.write_all(json.as_bytes())?;
+        // Serialize straight into a buffered file instead of building the whole document in memory
+        let mut writer = BufWriter::new(File::create(filename)?);
+        serde_json::to_writer_pretty(&mut writer, &json_metrics)?;
+        writer.flush()?;
         Ok(())
     }
 
@@ -61,27 +62,39 @@ impl MetricsStorage {
     /// Deprecated as metrics are now typically within benchmarks.
     #[deprecated = "Metrics are now typically part of benchmarks. Analyze benchmark results directly."]
     pub fn get_average_metrics_by_type(&self) -> HashMap<String, serde_json::Value> {
+        /// Running per-type totals, filled in a single pass over the metrics.
+        #[derive(Default)]
+        struct TypeTotals {
+            count: usize,
+            generation_ms: f64,
+            sui_ms: f64,
+            execution_ms: f64,
+            total_ms: f64,
+        }
+
         let metrics_list = self.get_all_metrics();
-        let mut type_groups: HashMap<String, Vec<&PerformanceMetrics>> = HashMap::new();
+        let mut type_totals: HashMap<&str, TypeTotals> = HashMap::new();
 
         for metric in &metrics_list {
-            type_groups.entry(metric.transaction_type.clone()).or_default().push(metric);
+            let totals = type_totals.entry(metric.transaction_type.as_str()).or_default();
+            totals.count += 1;
+            totals.generation_ms += metric.generation_time_ms().unwrap_or(0.0);
+            totals.sui_ms += metric.sui_time_ms().unwrap_or(0.0);
+            totals.execution_ms += metric.execution_time_ms().unwrap_or(0.0);
+            totals.total_ms += metric.total_time_ms().unwrap_or(0.0);
         }
 
-        let mut averages = HashMap::new();
-        for (tx_type, metrics) in type_groups {
-            if metrics.is_empty() {
-                continue;
-            }
-            let count = metrics.len() as f64;
+        let mut averages = HashMap::with_capacity(type_totals.len());
+        for (tx_type, totals) in type_totals {
+            let count = totals.count as f64;
 
-            let avg_gen_time: f64 = metrics.iter().filter_map(|m| m.generation_time_ms()).sum::<f64>() / count;
-            let avg_sui_time: f64 = metrics.iter().filter_map(|m| m.sui_time_ms()).sum::<f64>() / count;
-            let avg_exec_time: f64 = metrics.iter().filter_map(|m| m.execution_time_ms()).sum::<f64>() / count;
-            let avg_total_time: f64 = metrics.iter().filter_map(|m| m.total_time_ms()).sum::<f64>() / count;
+            let avg_gen_time = totals.generation_ms / count;
+            let avg_sui_time = totals.sui_ms / count;
+            let avg_exec_time = totals.execution_ms / count;
+            let avg_total_time = totals.total_ms / count;
             let middleware_overhead = if avg_sui_time > 0.0 { ((avg_gen_time + avg_exec_time) / avg_sui_time) * 100.0 } else { 0.0 };
 
-            averages.insert(tx_type, serde_json::json!({
+            averages.insert(tx_type.to_string(), serde_json::json!({
                 "sample_count": count,
                 "avg_generation_time_ms": avg_gen_time,
                 "avg_sui_time_ms": avg_sui_time,
@@ -143,10 +156,11 @@ impl MetricsStorage {
     pub fn save_benchmarks_to_json_file(&self, filename: &str) -> Result<()> {
         let benchmarks = self.get_all_benchmarks();
         let json_benchmarks: Vec<serde_json::Value> = benchmarks.iter().map(|b| b.to_json()).collect();
-        let json = serde_json::to_string_pretty(&json_benchmarks)?;
 
-        let mut file = File::create(filename)?;
-        file.write_all(json.as_bytes())?;
+        // Serialize straight into a buffered file instead of building the whole document in memory
+        let mut writer = BufWriter::new(File::create(filename)?);
+        serde_json::to_writer_pretty(&mut writer, &json_benchmarks)?;
+        writer.flush()?;
         Ok(())
     }
 
@@ -196,33 +210,28 @@ impl MetricsStorage {
                     println!("    Total Iterations: {}", total_iterations);
                     println!("    Avg Duration/Iteration: {:.3} ms", avg_duration_per_iter_ms);
 
-                    // Optionally print average for specific operations if desired
-                    // Example: Print average 'l1_submission' time
-                    let mut op_times = Vec::new();
-                    let mut op_counts = 0;
+                    // Average 'l1_submission' and 'total_iteration' times across benchmarks,
+                    // gathered together in a single pass: (sum of averages, benchmarks, calls)
+                    let mut l1_totals = (0.0_f64, 0usize, 0u32);
+                    let mut iteration_totals = (0.0_f64, 0usize, 0u32);
                     for b in &benchmarks {
                         if let Some(stats) = b.operation_stats.get("l1_submission") {
-                            op_times.push(stats.average_duration_ms());
-                            op_counts += stats.count;
+                            l1_totals.0 += stats.average_duration_ms();
+                            l1_totals.1 += 1;
+                            l1_totals.2 += stats.count;
+                        }
+                        if let Some(stats) = b.operation_stats.get("total_iteration") {
+                            iteration_totals.0 += stats.average_duration_ms();
+                            iteration_totals.1 += 1;
+                            iteration_totals.2 += stats.count;
                         }
                     }
-                    if !op_times.is_empty() && op_counts > 0{
-                        let avg_op_time: f64 = op_times.iter().sum::<f64>() / op_times.len() as f64;
-                        println!("    Avg 'l1_submission' time (across benchmarks): {:.3} ms (total calls: {})", avg_op_time, op_counts);
+                    for (op_name, (avg_sum, benchmark_count, call_count)) in [("l1_submission", l1_totals), ("total_iteration", iteration_totals)] {
+                        if benchmark_count > 0 && call_count > 0 {
+                            println!("    Avg '{}' time (across benchmarks): {:.3} ms (total calls: {})",
+                                     op_name, avg_sum / benchmark_count as f64, call_count);
+                        }
                     }
-                     // Example: Print average 'total_iteration' time
-                     let mut total_iter_times = Vec::new();
-                     let mut total_iter_counts = 0;
-                     for b in &benchmarks {
-                         if let Some(stats) = b.operation_stats.get("total_iteration") {
-                             total_iter_times.push(stats.average_duration_ms());
-                             total_iter_counts += stats.count;
-                         }
-                     }
-                     if !total_iter_times.is_empty() && total_iter_counts > 0{
-                         let avg_total_iter_time: f64 = total_iter_times.iter().sum::<f64>() / total_iter_times.len() as f64;
-                         println!("    Avg 'total_iteration' time (across benchmarks): {:.3} ms (total calls: {})", avg_total_iter_time, total_iter_counts);
-                     }
                 }
             }
         }
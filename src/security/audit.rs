@@ -7,7 +7,7 @@ use anyhow::{anyhow, Result};
 use chrono::{DateTime, Utc};
 use serde::{Deserialize, Serialize};
 use serde_json::Value;
-use std::collections::HashMap;
+use std::collections::{HashMap, VecDeque};
 use std::fs::{File, OpenOptions};
 use std::io::{BufWriter, Write};
 use std::path::PathBuf;
@@ -156,7 +156,8 @@ impl Default for AuditLogConfig {
 #[derive(Debug, Clone)]
 pub struct SecurityAuditLog {
     config: Arc<Mutex<AuditLogConfig>>,
-    events: Arc<Mutex<Vec<AuditEvent>>>,
+    /// Bounded ring buffer of recent events; the oldest entry is evicted first.
+    events: Arc<Mutex<VecDeque<AuditEvent>>>,
     max_events: usize,
 }
 
@@ -170,7 +171,7 @@ impl SecurityAuditLog {
     pub fn with_config(config: AuditLogConfig) -> Self {
         Self {
             config: Arc::new(Mutex::new(config)),
-            events: Arc::new(Mutex::new(Vec::new())),
+            events: Arc::new(Mutex::new(VecDeque::new())),
             max_events: 1000,
         }
     }
@@ -210,9 +211,9 @@ impl SecurityAuditLog {
         }
 
         if let Ok(mut events_guard) = self.events.lock() {
-            events_guard.push(event);
+            events_guard.push_back(event);
             if events_guard.len() > self.max_events {
-                events_guard.remove(0);
+                events_guard.pop_front();
             }
         } else {
             eprintln!("ERROR: Events mutex poisoned. Event not added to in-memory buffer.");
@@ -228,35 +229,46 @@ impl SecurityAuditLog {
                 eprintln!("ERROR: Events mutex poisoned while getting events: {}", poisoned);
                 Vec::new()
             },
-            |guard| guard.clone(),
+            |guard| guard.iter().cloned().collect(),
+        )
+    }
+
+    /// Clones only the buffered events matching `predicate`, filtering under the lock
+    /// instead of cloning the whole buffer first.
+    fn filter_events<F: Fn(&AuditEvent) -> bool>(&self, predicate: F) -> Vec<AuditEvent> {
+        self.events.lock().map_or_else(
+            |poisoned| {
+                eprintln!("ERROR: Events mutex poisoned while filtering events: {}", poisoned);
+                Vec::new()
+            },
+            |guard| guard.iter().filter(|e| predicate(e)).cloned().collect(),
         )
     }
 
     /// Filters in-memory events by severity.
     pub fn get_events_by_severity(&self, severity: AuditSeverity) -> Vec<AuditEvent> {
-        self.get_events().into_iter().filter(|e| e.severity == severity).collect()
+        self.filter_events(|e| e.severity == severity)
     }
 
     /// Filters in-memory events by type.
     pub fn get_events_by_type(&self, event_type: AuditEventType) -> Vec<AuditEvent> {
-        self.get_events().into_iter().filter(|e| e.event_type == event_type).collect()
+        self.filter_events(|e| e.event_type == event_type)
     }
 
     /// Filters in-memory events by transaction ID.
     pub fn get_events_by_transaction(&self, transaction_id: &str) -> Vec<AuditEvent> {
-        self.get_events().into_iter()
-            .filter(|e| e.transaction_id.as_deref() == Some(transaction_id))
-            .collect()
+        self.filter_events(|e| e.transaction_id.as_deref() == Some(transaction_id))
     }
 
     /// Exports all events from the in-memory buffer to a JSON file.
     pub fn export_events_to_json(&self, path: &str) -> Result<()> {
         let events = self.get_events();
         let json_value = serde_json::to_value(&events)?;
-        let json_string = serde_json::to_string_pretty(&json_value)?;
 
-        let mut file = File::create(path)?;
-        file.write_all(json_string.as_bytes())?;
+        // Write through a buffer rather than rendering the whole export to a String first
+        let mut writer = BufWriter::new(File::create(path)?);
+        serde_json::to_writer_pretty(&mut writer, &json_value)?;
+        writer.flush()?;
         Ok(())
     }
 
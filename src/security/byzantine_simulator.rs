@@ -94,10 +94,11 @@ impl ByzantineSimulator {
     
     /// Simulate responses from nodes (for testing byzantine behavior)
     pub async fn simulate_responses(&self, _endpoint: &str, node_count: usize) -> Vec<NodeResponse> {
-        let mut responses = Vec::new();
+        let mut responses = Vec::with_capacity(node_count);
         let mut rng = thread_rng();
         
-        let majority_data = format!("{}", rng.gen_range(1, 1000));
+        // Build the honest payload once; every honest node reports the same value
+        let majority_data = json!(rng.gen_range(1, 1000));
         
         for i in 0..node_count {
             let node_id = format!("node_{}", i);
@@ -105,11 +106,11 @@ impl ByzantineSimulator {
             
             let response = if is_byzantine {
                 // Generate different data for byzantine nodes
-                let byzantine_data = format!("{}", rng.gen_range(1001, 2000));
+                let byzantine_data = json!(rng.gen_range(1001, 2000));
                 NodeResponse {
                     node_url: node_id,
                     status: NodeResponseStatus::Inconsistent,
-                    data: Some(serde_json::from_str(&byzantine_data).unwrap_or(serde_json::Value::Null)),
+                    data: Some(byzantine_data),
                     error: None,
                     response_time_ms: Some(rng.gen_range(100, 500)),
                     timestamp: Instant::now(),
@@ -119,7 +120,7 @@ impl ByzantineSimulator {
                 NodeResponse {
                     node_url: node_id,
                     status: NodeResponseStatus::Valid,
-                    data: Some(serde_json::from_str(&majority_data).unwrap_or(serde_json::Value::Null)),
+                    data: Some(majority_data.clone()),
                     error: None,
                     response_time_ms: Some(rng.gen_range(50, 200)),
                     timestamp: Instant::now(),
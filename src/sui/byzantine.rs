@@ -402,15 +402,9 @@ impl ByzantineDetector {
         let history = self.response_history.lock().unwrap();
         
         if let Some(responses) = history.get(digest) {
-            // Get response times
-            let response_times: Vec<(String, u64)> = responses.iter()
-                .filter_map(|r| {
-                    if let Some(time) = r.response_time_ms {
-                        Some((r.node_url.clone(), time))
-                    } else {
-                        None
-                    }
-                })
+            // Get response times, borrowing node URLs from the history instead of cloning them
+            let response_times: Vec<(&str, u64)> = responses.iter()
+                .filter_map(|r| r.response_time_ms.map(|time| (r.node_url.as_str(), time)))
                 .collect();
             
             // Calculate average and standard deviation
@@ -428,12 +422,12 @@ impl ByzantineDetector {
                 let std_dev = variance.sqrt();
                 
                 // Check for outliers (more than 2 standard deviations)
-                let outliers: Vec<(&String, &u64)> = response_times.iter()
+                let outliers: Vec<(&str, u64)> = response_times.iter()
                     .filter(|(_, time)| {
                         let diff = (*time as f64 - avg).abs();
                         diff > 2.0 * std_dev
                     })
-                    .map(|(url, time)| (url, time))
+                    .copied()
                     .collect();
                 
                 if !outliers.is_empty() {
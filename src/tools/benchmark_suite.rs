@@ -27,9 +27,10 @@ use anyhow::{anyhow, Context, Result};
 use std::str::FromStr;
 use std::sync::Arc;
 use std::time::{Duration, Instant};
+use std::fmt::Write;
 use std::fs;
 use chrono;
-use rand::Rng;
+use rand::{rngs::StdRng, Rng, SeedableRng};
 
 // Sui SDK imports
 use sui_sdk::{
@@ -165,15 +166,16 @@ pub async fn run_comprehensive_benchmarks(output_dir: &str) -> Result<(), Box<dy
     
     // --- Generate Summary File --- 
     let summary_path = format!("{}/benchmark_summary.txt", output_dir);
+    // Format directly into one buffer instead of allocating a temporary String per line
     let mut summary = String::new();
-    summary.push_str("Suimodular Comprehensive Benchmarks Summary\n");
-    summary.push_str(&format!("Date: {}\n", chrono::Local::now().to_rfc2822()));
-    summary.push_str(&format!("Results Directory: {}\n", output_dir));
+    writeln!(summary, "Suimodular Comprehensive Benchmarks Summary")?;
+    writeln!(summary, "Date: {}", chrono::Local::now().to_rfc2822())?;
+    writeln!(summary, "Results Directory: {}", output_dir)?;
     let total_duration = start_time.elapsed();
-    summary.push_str(&format!("Total Duration: {:?}\n", total_duration));
-    summary.push_str("Quorum Size: n=5, Threshold t=4 (2f+1 for f=1)\n");
-    summary.push_str(&format!("Iterations per scenario: {}\n", BENCHMARK_ITERATIONS));
-    summary.push_str(&format!("Byzantine percentages tested: {:?}\n", BYZANTINE_PERCENTAGES.iter().map(|p| format!("{:.1}%", p * 100.0)).collect::<Vec<_>>() ));
+    writeln!(summary, "Total Duration: {:?}", total_duration)?;
+    writeln!(summary, "Quorum Size: n=5, Threshold t=4 (2f+1 for f=1)")?;
+    writeln!(summary, "Iterations per scenario: {}", BENCHMARK_ITERATIONS)?;
+    writeln!(summary, "Byzantine percentages tested: {:?}", BYZANTINE_PERCENTAGES.iter().map(|p| format!("{:.1}%", p * 100.0)).collect::<Vec<_>>())?;
     fs::write(&summary_path, summary)?;
     println!("Benchmark summary written to {}", summary_path);
     
@@ -224,6 +226,9 @@ async fn run_end_to_end_performance(
     println!("    Using Gas Object ID: {}", gas_object_id);
     println!("    Using Config Object ID: {}", config_object_id);
 
+    // Seed one generator for the whole run rather than fetching the thread RNG per iteration
+    let mut payload_rng = StdRng::from_entropy();
+
     for i in 0..BENCHMARK_ITERATIONS {
         let iteration_start = Instant::now();
 
@@ -235,7 +240,7 @@ async fn run_end_to_end_performance(
                         .as_millis();
         unique_payload[0..8].copy_from_slice(&i.to_le_bytes());
         unique_payload[8..24].copy_from_slice(&now_ms.to_le_bytes());
-        rand::thread_rng().fill(&mut unique_payload[24..]);
+        payload_rng.fill(&mut unique_payload[24..]);
 
         // 2. Request signatures from the quorum simulation (0% Byzantine here)
         let quorum_size = quorum_simulation.keypairs.len();
@@ -429,6 +434,9 @@ async fn run_byzantine_resilience(
     let function_name = Identifier::from_str(config::VERIFICATION_CONTRACT_FUNCTION)?;
     let config_object_id = ObjectID::from_str(config::VERIFICATION_CONTRACT_CONFIG_OBJECT_ID)?;
 
+    // Seed one generator for the whole run rather than fetching the thread RNG per iteration
+    let mut payload_rng = StdRng::from_entropy();
+
     // Test each Byzantine percentage
     for &percentage in BYZANTINE_PERCENTAGES.iter() {
         println!("    Running Benchmark with {:.1}% Byzantine Nodes...", percentage * 100.0);
@@ -469,7 +477,7 @@ async fn run_byzantine_resilience(
                             .as_millis();
             unique_payload[0..8].copy_from_slice(&i.to_le_bytes());
             unique_payload[8..24].copy_from_slice(&now_ms.to_le_bytes());
-            rand::thread_rng().fill(&mut unique_payload[24..]);
+            payload_rng.fill(&mut unique_payload[24..]);
 
             // 2. Request signatures from quorum (with simulated Byzantine behavior)
             let quorum_size = current_sim_arc.keypairs.len();